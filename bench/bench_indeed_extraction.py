@@ -0,0 +1,46 @@
+"""Compare embedded-JSON and DOM extraction of an Indeed results page.
+
+Runs both parsers over the saved fixture page and reports time per page and
+how many record fields each one fills in.
+
+    python bench/bench_indeed_extraction.py [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from job_scraper import IndeedScraper
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'indeed_results_embedded.html')
+
+
+def field_coverage(jobs):
+    filled = sum(
+        1 for job in jobs for value in job.to_dict().values()
+        if value not in (None, "", "Not specified")
+    )
+    return filled / len(jobs) if jobs else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        page_source = f.read()
+    scraper = IndeedScraper.__new__(IndeedScraper)
+
+    for name, extract in [('embedded', scraper._extract_embedded_job_listings),
+                          ('dom', scraper._extract_dom_job_listings)]:
+        seconds = timeit.timeit(lambda: extract(page_source), number=args.repeat)
+        jobs = extract(page_source)
+        print(f"{name:>8}: {seconds / args.repeat * 1000:.3f} ms/page, "
+              f"{len(jobs)} jobs, {field_coverage(jobs):.1f} fields/job")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Compare memory use of dict jobs and JobRecord jobs on a large run.
+
+Each variant runs in its own process. It builds N jobs the way the scrapers
+do: every field value is a freshly parsed string, so repeated company and
+location values are separate objects unless interned. Dict keys are shared
+literals, as in the scrapers' dict literals. The interned-dict variant
+separates the saving from interning from the saving from __slots__.
+Reports traced bytes per job and, from a separate untraced process, peak RSS.
+
+    python bench/bench_job_record.py [--jobs 50000]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from job_record import INTERNED_FIELDS, JobRecord
+
+VARIANTS = ['dict', 'interned-dict', 'record']
+LOCATIONS = ['Remote', 'Bengaluru, Karnataka', 'Chennai, Tamil Nadu']
+
+
+def scraped_fields(count):
+    """Yield job fields as fresh string objects, one job at a time."""
+    for i in range(count):
+        yield json.loads(json.dumps({
+            'title': f'Machine Learning Engineer {i % 50}',
+            'company': f'Company {i % 500}',
+            'location': LOCATIONS[i % len(LOCATIONS)],
+            'link': f'https://www.indeed.com/viewjob?jk={i:016x}',
+            'source': 'Indeed',
+            'salary': 'Not specified',
+            'description': f'Build and deploy machine learning models with Python and SQL. Job {i}.',
+            'job_key': f'{i:016x}'
+        }))
+
+
+def as_dict(fields, intern=False):
+    """Build a job dict with literal keys, as the scrapers did before JobRecord."""
+    def value(name):
+        return sys.intern(fields[name]) if intern and name in INTERNED_FIELDS else fields[name]
+
+    return {
+        'title': fields['title'],
+        'company': value('company'),
+        'location': value('location'),
+        'salary': value('salary'),
+        'description': fields['description'],
+        'link': fields['link'],
+        'source': value('source'),
+        'job_key': fields['job_key']
+    }
+
+
+def build(variant, count):
+    if variant == 'dict':
+        return [as_dict(fields) for fields in scraped_fields(count)]
+    if variant == 'interned-dict':
+        return [as_dict(fields, intern=True) for fields in scraped_fields(count)]
+    return [JobRecord(**fields) for fields in scraped_fields(count)]
+
+
+def measure(variant, metric, count):
+    if metric == 'traced':
+        tracemalloc.start()
+        jobs = build(variant, count)
+        value = tracemalloc.get_traced_memory()[0] / len(jobs)
+        tracemalloc.stop()
+    else:
+        # Tracing inflates RSS, so peak RSS is measured in an untraced process
+        jobs = build(variant, count)
+        value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(value))
+
+
+def run_measurement(variant, metric, count):
+    output = subprocess.run(
+        [sys.executable, __file__, '--variant', variant, '--metric', metric, '--jobs', str(count)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=50000)
+    parser.add_argument('--variant', choices=VARIANTS)
+    parser.add_argument('--metric', choices=['traced', 'rss'])
+    args = parser.parse_args()
+
+    if args.variant:
+        measure(args.variant, args.metric, args.jobs)
+        return
+
+    baseline_rss = run_measurement('dict', 'rss', 0)
+    print(f"{args.jobs} jobs, interpreter baseline RSS {baseline_rss:.1f} MB")
+    for variant in VARIANTS:
+        bytes_per_job = run_measurement(variant, 'traced', args.jobs)
+        peak_rss = run_measurement(variant, 'rss', args.jobs)
+        print(f"{variant:>13}: {bytes_per_job:.0f} bytes/job, peak RSS {peak_rss:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,22 +2,54 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY
 from selenium.webdriver.support import expected_conditions as EC
 import chromedriver_autoinstaller
 import json
+import logging
 import os
+import shutil
+import tempfile
+import time
+from replay_driver import RecordingDriver, ReplayDriver
 
 class BrowserHandler:
     def __init__(self, config_path='../config/config.json'):
         self.config = self._load_config(config_path)
-        chromedriver_autoinstaller.install()  # This will install the correct chromedriver version
-        self.driver = self._setup_driver()
+        browser_settings = self.config.get('browser_settings', {})
+        # 'live' drives Chrome, 'record' also captures every page, 'replay' serves a capture offline
+        self.mode = browser_settings.get('mode', 'live')
+        self.delay_scale = browser_settings.get('replay_delay_scale', 0.0) if self.mode == 'replay' else 1.0
+        if self.mode == 'replay':
+            self.driver = ReplayDriver(self._archive_path(), self.delay_scale)
+            self.replay_dir = self._setup_replay_dir()
+            self._restored_state = set()
+            logging.info(f"Replaying {self._archive_path()}, state and output files go to {self.replay_dir}")
+        else:
+            chromedriver_autoinstaller.install()  # This will install the correct chromedriver version
+            self.driver = self._setup_driver()
+            if self.mode == 'record':
+                self.driver = RecordingDriver(self.driver, self._archive_path())
         
     def _load_config(self, config_path):
         config_path = os.path.join(os.path.dirname(__file__), config_path)
         with open(config_path, 'r') as f:
             return json.load(f)
     
+    def _archive_path(self):
+        archive_path = self.config.get('browser_settings', {}).get('archive_path', '../captures/capture.json.gz')
+        return os.path.join(os.path.dirname(__file__), archive_path)
+    
+    def _setup_replay_dir(self):
+        """Use the configured replay_dir, or a temporary one that close() removes."""
+        replay_dir = self.config.get('browser_settings', {}).get('replay_dir')
+        self.keep_replay_dir = bool(replay_dir)
+        if not replay_dir:
+            return tempfile.mkdtemp(prefix='job_agent_replay_')
+        replay_dir = os.path.join(os.path.dirname(__file__), replay_dir)
+        os.makedirs(replay_dir, exist_ok=True)
+        return replay_dir
+    
     def _setup_driver(self):
         chrome_options = Options()
         if self.config.get('browser_settings', {}).get('headless', False):
@@ -32,13 +64,52 @@ class BrowserHandler:
         driver.implicitly_wait(self.config.get('browser_settings', {}).get('timeout', 20))
         return driver
     
+    def state_path(self, filename, capture='start'):
+        """Path for a state file the agents read and write between runs.
+
+        Recording stores the file in the capture, as it is at startup or, for
+        capture='end', when the run finishes. Replay restores it into a
+        scratch directory so the live file is never read or written.
+        """
+        if self.mode == 'record':
+            self.driver.track_state(filename, capture)
+        elif self.mode == 'replay':
+            path = os.path.join(self.replay_dir, filename)
+            # Start every replay from the captured state, even in a kept replay_dir
+            if filename not in self._restored_state:
+                self._restored_state.add(filename)
+                content = self.driver.state.get(filename)
+                if content is not None:
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                elif os.path.exists(path):
+                    os.remove(path)
+            return path
+        return filename
+    
+    def output_path(self, filename):
+        if self.mode == 'replay':
+            return os.path.join(self.replay_dir, filename)
+        return filename
+    
+    def pause(self, seconds):
+        """Sleep between browser actions, scaled down or skipped when replaying."""
+        time.sleep(seconds * self.delay_scale)
+    
+    def wait(self, timeout):
+        # Scale polling with the timeout; WebDriverWait treats a poll of 0 as its 0.5s default
+        poll_frequency = max(POLL_FREQUENCY * self.delay_scale, 0.001)
+        return WebDriverWait(self.driver, timeout * self.delay_scale, poll_frequency=poll_frequency)
+    
     def wait_for_element(self, by, value, timeout=None):
         if timeout is None:
             timeout = self.config.get('browser_settings', {}).get('timeout', 20)
-        return WebDriverWait(self.driver, timeout).until(
+        return self.wait(timeout).until(
             EC.presence_of_element_located((by, value))
         )
     
     def close(self):
         if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
\ No newline at end of file
+            self.driver.quit()
+        if getattr(self, 'replay_dir', None) and not self.keep_replay_dir:
+            shutil.rmtree(self.replay_dir, ignore_errors=True)
\ No newline at end of file
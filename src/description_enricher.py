@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
+import urllib3
+import json
+import logging
+import os
+import time
+
+# Containers holding the full posting text on each site's job page
+DESCRIPTION_SELECTORS = {
+    'Indeed': ['#jobDescriptionText', '.jobsearch-jobDescriptionText']
+}
+
+class DescriptionEnricher:
+    """Fetches full job descriptions over HTTP with a bounded worker pool.
+
+    Pages are requested with the browser's cookies and user agent so the
+    logged-in session carries over without tying up the Selenium driver.
+    Descriptions are cached on disk by job key or link across runs, keeping
+    at most cache_max_entries entries no older than cache_max_age_days.
+    """
+
+    def __init__(self, config, site, cache_path='description_cache.json', offline=False):
+        self.site = site
+        self.offline = offline
+        enrichment_config = config.get('description_enrichment', {})
+        self.enabled = enrichment_config.get('enabled', True)
+        self.max_workers = enrichment_config.get('max_workers', {}).get(site, 4)
+        self.timeout = enrichment_config.get('timeout', 10)
+        self.cache_max_entries = enrichment_config.get('cache_max_entries', 5000)
+        self.cache_max_age = enrichment_config.get('cache_max_age_days', 30) * 24 * 60 * 60
+        self.cache_path = cache_path
+        self.cache = self._load_cache()
+        self.headers = {}
+        self.http = urllib3.PoolManager(
+            maxsize=self.max_workers,
+            timeout=urllib3.Timeout(total=self.timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5)
+        )
+
+    def _load_cache(self):
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r') as f:
+                return self._prune_cache(json.load(f))
+        return {}
+
+    def _prune_cache(self, cache):
+        """Drop expired entries and keep only the most recently fetched ones."""
+        # Offline replays keep every captured entry however old the capture is
+        oldest_allowed = 0 if self.offline else time.time() - self.cache_max_age
+        entries = [
+            (key, entry) for key, entry in cache.items()
+            if isinstance(entry, dict) and entry.get('fetched_at', 0) >= oldest_allowed
+        ]
+        entries.sort(key=lambda item: item[1]['fetched_at'], reverse=True)
+        return dict(entries[:self.cache_max_entries])
+
+    def _save_cache(self):
+        self.cache = self._prune_cache(self.cache)
+        with open(self.cache_path, 'w') as f:
+            json.dump(self.cache, f)
+
+    def use_browser_session(self, driver):
+        """Copy the cookies and user agent of a logged-in browser session."""
+        try:
+            cookies = '; '.join(f"{c['name']}={c['value']}" for c in driver.get_cookies())
+            self.headers = {
+                'User-Agent': driver.execute_script("return navigator.userAgent"),
+                'Cookie': cookies
+            }
+        except Exception as e:
+            logging.warning(f"Could not copy browser session: {str(e)}")
+
+    def _cache_key(self, job):
+        return job.get('job_key') or job['link']
+
+    def _parse_description(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        for selector in DESCRIPTION_SELECTORS.get(self.site, []):
+            element = soup.select_one(selector)
+            if element:
+                return element.get_text(" ", strip=True)
+        return None
+
+    def _fetch_description(self, job):
+        try:
+            response = self.http.request('GET', job['link'], headers=self.headers)
+            if response.status != 200:
+                logging.warning(f"Got status {response.status} fetching description for {job['link']}")
+                return None
+            return self._parse_description(response.data.decode('utf-8', errors='replace'))
+        except Exception as e:
+            logging.warning(f"Error fetching description for {job['link']}: {str(e)}")
+            return None
+
+    def enrich(self, jobs):
+        """Replace each job's snippet with its full description where one can be fetched."""
+        if not self.enabled or not jobs:
+            return jobs
+
+        if self.offline:
+            to_fetch = []
+        else:
+            to_fetch = [job for job in jobs if self._cache_key(job) not in self.cache]
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                descriptions = list(executor.map(self._fetch_description, to_fetch))
+            fetched_at = time.time()
+            for job, description in zip(to_fetch, descriptions):
+                if description:
+                    self.cache[self._cache_key(job)] = {'description': description, 'fetched_at': fetched_at}
+            self._save_cache()
+
+        enriched = 0
+        for job in jobs:
+            entry = self.cache.get(self._cache_key(job))
+            if entry:
+                job['snippet'] = job.get('description', "")
+                job['description'] = entry['description']
+                enriched += 1
+
+        logging.info(f"Fetched full descriptions for {enriched} of {len(jobs)} jobs "
+                     f"({len(jobs) - len(to_fetch)} cached)")
+        return jobs
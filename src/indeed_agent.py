@@ -4,7 +4,8 @@ import json
 import logging
 from datetime import datetime
 import os
-import time
+from query_planner import QueryPlanner
+from description_enricher import DescriptionEnricher
 
 class IndeedAgent:
     def __init__(self, config_path='../config/config.json'):
@@ -12,7 +13,16 @@ class IndeedAgent:
         self.config = self._load_config(config_path)
         self.browser_handler = BrowserHandler(config_path)
         self.scraper = IndeedScraper(self.browser_handler)
+        self.applied_jobs_path = self.browser_handler.state_path('applied_jobs.json')
         self.applied_jobs = self._load_applied_jobs()
+        self.applied_keys = {self._applied_key(applied_job) for applied_job in self.applied_jobs}
+        self.planner = QueryPlanner(self.config, 'Indeed', self.browser_handler.state_path('query_stats.json'))
+        # Replayed runs stay offline and only use the descriptions cached by the recorded run
+        self.enricher = DescriptionEnricher(
+            self.config, 'Indeed',
+            cache_path=self.browser_handler.state_path('description_cache.json', capture='end'),
+            offline=self.browser_handler.mode == 'replay'
+        )
         
     def _setup_logging(self):
         logging.basicConfig(
@@ -30,29 +40,23 @@ class IndeedAgent:
             return json.load(f)
     
     def _load_applied_jobs(self):
-        if os.path.exists('applied_jobs.json'):
-            with open('applied_jobs.json', 'r') as f:
+        if os.path.exists(self.applied_jobs_path):
+            with open(self.applied_jobs_path, 'r') as f:
                 return json.load(f)
         return []
     
     def _save_applied_jobs(self):
-        with open('applied_jobs.json', 'w') as f:
+        with open(self.applied_jobs_path, 'w') as f:
             json.dump(self.applied_jobs, f)
     
-    def _filter_job(self, job):
+    def _applied_key(self, job):
+        # Older entries only stored the link, which may be a viewjob or rc/clk URL
+        return job.get('job_key') or IndeedScraper._job_key_from_url(job['link']) or job['link']
+    
+    def _prefilter_job(self, job):
+        """Checks that don't need the job description."""
         title_lower = job['title'].lower()
-        description_lower = job['description'].lower()
-        
-        # Check required keywords in title or description
-        has_required_skill = False
-        for keyword in self.config['auto_apply']['required_keywords']:
-            if keyword.lower() in title_lower or keyword.lower() in description_lower:
-                has_required_skill = True
-                break
         
-        if not has_required_skill:
-            return False
-            
         # Check excluded keywords
         if any(keyword.lower() in title_lower for keyword in self.config['auto_apply']['exclude_keywords']):
             return False
@@ -62,11 +66,32 @@ class IndeedAgent:
             return False
             
         # Check if already applied
-        if job['link'] in [applied_job['link'] for applied_job in self.applied_jobs]:
+        if self._applied_key(job) in self.applied_keys:
             return False
             
         return True
     
+    def _filter_job(self, job):
+        title_lower = job['title'].lower()
+        description_lower = job['description'].lower()
+        
+        # Check required keywords in title or description
+        has_required_skill = False
+        for keyword in self.config['auto_apply']['required_keywords']:
+            if keyword.lower() in title_lower or keyword.lower() in description_lower:
+                has_required_skill = True
+                break
+        
+        if not has_required_skill:
+            return False
+            
+        return self._prefilter_job(job)
+    
+    def _filter_jobs(self, jobs):
+        # Match required keywords against the full description, not the results card snippet
+        candidates = self.enricher.enrich([job for job in jobs if self._prefilter_job(job)])
+        return [job for job in candidates if self._filter_job(job)]
+    
     def run(self):
         try:
             logging.info("Starting job search...")
@@ -75,44 +100,50 @@ class IndeedAgent:
             if not self.scraper.login():
                 logging.error("Failed to login to Indeed. Please check your credentials.")
                 return
+            self.enricher.use_browser_session(self.browser_handler.driver)
             
             total_applications = 0
             max_applications = self.config['auto_apply']['max_applications_per_day']
             
-            # Search for each keyword and location combination
-            for keyword in self.config['job_search']['keywords']:
-                for location in self.config['job_search']['locations']:
+            # Search the planned keyword and location combinations
+            for keyword, location in self.planner.plan():
+                if total_applications >= max_applications:
+                    logging.info("Reached maximum applications for today")
+                    break
+                    
+                logging.info(f"Searching for {keyword} jobs in {location}")
+                jobs = self.scraper.search_jobs(keyword, location)
+                
+                # Only filter jobs that earlier searches in this run haven't already returned
+                jobs = self.planner.record(keyword, location, jobs)
+                
+                filtered_jobs = self._filter_jobs(jobs)
+                logging.info(f"Found {len(filtered_jobs)} matching jobs for {keyword} in {location}")
+                
+                for job in filtered_jobs:
                     if total_applications >= max_applications:
-                        logging.info("Reached maximum applications for today")
                         break
                         
-                    logging.info(f"Searching for {keyword} jobs in {location}")
-                    jobs = self.scraper.search_jobs(keyword, location)
-                    
-                    filtered_jobs = [job for job in jobs if self._filter_job(job)]
-                    logging.info(f"Found {len(filtered_jobs)} matching jobs for {keyword} in {location}")
-                    
-                    for job in filtered_jobs:
-                        if total_applications >= max_applications:
-                            break
+                    try:
+                        logging.info(f"Attempting to apply: {job['title']} at {job['company']}")
+                        if self.scraper.apply_to_job(job['link']):
+                            job['applied_date'] = datetime.now().isoformat()
+                            self.applied_jobs.append(job.to_dict())
+                            self.applied_keys.add(self._applied_key(job))
+                            total_applications += 1
+                            logging.info(f"Successfully applied to job at {job['company']}")
+                            self._save_applied_jobs()  # Save after each successful application
+                            self.browser_handler.pause(5)  # Wait between applications
+                        else:
+                            logging.warning(f"Could not apply to job at {job['company']}")
                             
-                        try:
-                            logging.info(f"Attempting to apply: {job['title']} at {job['company']}")
-                            if self.scraper.apply_to_job(job['link']):
-                                job['applied_date'] = datetime.now().isoformat()
-                                self.applied_jobs.append(job)
-                                total_applications += 1
-                                logging.info(f"Successfully applied to job at {job['company']}")
-                                self._save_applied_jobs()  # Save after each successful application
-                                time.sleep(5)  # Wait between applications
-                            else:
-                                logging.warning(f"Could not apply to job at {job['company']}")
-                                
-                        except Exception as e:
-                            logging.error(f"Error applying to job: {str(e)}")
-                            continue
-                    
-                    time.sleep(3)  # Wait between searches
+                    except Exception as e:
+                        logging.error(f"Error applying to job: {str(e)}")
+                        continue
+                
+                self.browser_handler.pause(3)  # Wait between searches
+            
+            self.planner.log_summary()
             
             # Save all jobs to CSV for reference
             csv_file = self.scraper.save_jobs_to_csv()
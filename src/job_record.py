@@ -0,0 +1,55 @@
+import sys
+
+# Fields repeated across many jobs in a run; interned so records share one copy
+INTERNED_FIELDS = ('company', 'location', 'salary', 'source', 'salary_type')
+
+class JobRecord:
+    """A scraped job posting.
+
+    Uses __slots__ instead of a per-job dict and interns low-cardinality
+    fields, which keeps large runs small in memory. Supports the subscript
+    access the agents use on jobs; call to_dict() when writing output.
+    """
+
+    __slots__ = (
+        'title', 'company', 'location', 'link', 'source', 'description',
+        'snippet', 'salary', 'salary_min', 'salary_max', 'salary_type',
+        'job_key', 'posted_date', 'easy_apply', 'applied_date'
+    )
+
+    def __init__(self, title, company, location, link, source, **fields):
+        for field in self.__slots__:
+            setattr(self, field, None)
+        self['title'] = title
+        self['company'] = company
+        self['location'] = location
+        self['link'] = link
+        self['source'] = source
+        for field, value in fields.items():
+            self[field] = value
+
+    def __getitem__(self, field):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        if field in INTERNED_FIELDS and isinstance(value, str):
+            value = sys.intern(value)
+        setattr(self, field, value)
+
+    def get(self, field, default=None):
+        value = getattr(self, field, None) if field in self.__slots__ else None
+        return default if value is None else value
+
+    def to_dict(self):
+        return {
+            field: getattr(self, field)
+            for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+
+    def __repr__(self):
+        return f"JobRecord({self.title!r}, {self.company!r}, {self.source!r})"
@@ -1,14 +1,22 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import logging
 import json
+import re
+from urllib.parse import quote_plus, urlparse, parse_qs
+from datetime import datetime, timezone
 from browser_handler import BrowserHandler
+from job_record import JobRecord
+
+# Indeed ships the result cards as JSON in a script tag before rendering them
+MOSAIC_JOBCARDS_PATTERN = re.compile(
+    r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*'
+)
+VIEWJOB_URL = "https://www.indeed.com/viewjob?jk={}"
 
 class IndeedScraper:
     def __init__(self, browser_handler):
@@ -24,13 +32,13 @@ class IndeedScraper:
             
         try:
             self.driver.get("https://secure.indeed.com/auth")
-            time.sleep(2)  # Wait for any redirects
+            self.browser.pause(2)  # Wait for any redirects
             
             # Enter email
             email_field = self.browser.wait_for_element(By.ID, "ifl-InputFormField-3")
             email_field.send_keys(self.config['credentials']['indeed_email'])
             email_field.send_keys(Keys.RETURN)
-            time.sleep(2)
+            self.browser.pause(2)
             
             # Enter password
             password_field = self.browser.wait_for_element(By.ID, "ifl-InputFormField-7")
@@ -38,7 +46,7 @@ class IndeedScraper:
             password_field.send_keys(Keys.RETURN)
             
             # Wait for login to complete
-            time.sleep(5)
+            self.browser.pause(5)
             self.logged_in = True
             logging.info("Successfully logged into Indeed")
             return True
@@ -49,14 +57,14 @@ class IndeedScraper:
     
     def search_jobs(self, keyword, location):
         try:
-            search_url = f"https://www.indeed.com/jobs?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
+            search_url = f"https://www.indeed.com/jobs?q={quote_plus(keyword)}&l={quote_plus(location)}"
             if self.config['job_search'].get('job_type'):
                 search_url += f"&jt={self.config['job_search']['job_type']}"
             if self.config['job_search'].get('posted_within'):
                 search_url += "&fromage=14"  # Last 14 days
                 
             self.driver.get(search_url)
-            time.sleep(3)  # Wait for results to load
+            self.browser.pause(3)  # Wait for results to load
             return self._extract_job_listings()
             
         except Exception as e:
@@ -64,9 +72,74 @@ class IndeedScraper:
             return []
     
     def _extract_job_listings(self):
+        page_source = self.driver.page_source
+        jobs = self._extract_embedded_job_listings(page_source)
+        if jobs is None:
+            logging.info("Embedded job data not found, falling back to DOM parsing")
+            jobs = self._extract_dom_job_listings(page_source)
+        self.jobs_data.extend(jobs)
+        logging.info(f"Found {len(jobs)} jobs")
+        return jobs
+
+    def _extract_embedded_job_listings(self, page_source):
+        """Parse the job cards from the embedded mosaic JSON payload.
+
+        Returns None when the payload is missing or unreadable so the caller
+        can fall back to DOM parsing.
+        """
+        match = MOSAIC_JOBCARDS_PATTERN.search(page_source)
+        if not match:
+            return None
+
+        try:
+            payload, _ = json.JSONDecoder().raw_decode(page_source, match.end())
+            results = payload['metaData']['mosaicProviderJobCardsModel']['results']
+        except (ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Failed to parse embedded job data: {str(e)}")
+            return None
+
+        jobs = []
+        for result in results:
+            try:
+                job_key = result['jobkey']
+                salary_snippet = result.get('salarySnippet') or {}
+                extracted_salary = result.get('extractedSalary') or {}
+                snippet = result.get('snippet') or ""
+                pub_date = result.get('pubDate')
+
+                job = JobRecord(
+                    title=result['title'].strip(),
+                    company=(result.get('company') or "").strip(),
+                    location=(result.get('formattedLocation') or "").strip(),
+                    link=VIEWJOB_URL.format(job_key),
+                    source='Indeed',
+                    salary=salary_snippet.get('text') or "Not specified",
+                    description=BeautifulSoup(snippet, 'html.parser').get_text(" ", strip=True) if '<' in snippet else snippet.strip(),
+                    job_key=job_key,
+                    posted_date=datetime.fromtimestamp(pub_date / 1000, tz=timezone.utc).isoformat() if pub_date else None,
+                    salary_min=extracted_salary.get('min'),
+                    salary_max=extracted_salary.get('max'),
+                    salary_type=extracted_salary.get('type')
+                )
+
+                jobs.append(job)
+
+            except (KeyError, TypeError, AttributeError) as e:
+                logging.warning(f"Failed to parse embedded job card: {str(e)}")
+                continue
+
+        return jobs
+
+    @staticmethod
+    def _job_key_from_url(url):
+        """Get the job key from the jk parameter of a viewjob or rc/clk URL."""
+        job_key = parse_qs(urlparse(url).query).get('jk')
+        return job_key[0] if job_key else None
+
+    def _extract_dom_job_listings(self, page_source):
         jobs = []
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, 'html.parser')
             job_cards = soup.find_all('div', class_='job_seen_beacon')
             
             for card in job_cards:
@@ -76,12 +149,15 @@ class IndeedScraper:
                     company = card.find('span', class_='companyName').text.strip()
                     location = card.find('div', class_='companyLocation').text.strip()
                     
-                    # Get job link
+                    # Get job link, in the same form as the embedded listings
                     job_link = card.find('a', class_='jcs-JobTitle')
                     if job_link and 'href' in job_link.attrs:
                         link = 'https://www.indeed.com' + job_link['href']
                     else:
                         continue
+                    job_key = job_link.get('data-jk') or self._job_key_from_url(link)
+                    if job_key:
+                        link = VIEWJOB_URL.format(job_key)
                         
                     # Extract salary if available
                     salary_elem = card.find('div', class_='salary-snippet')
@@ -91,15 +167,16 @@ class IndeedScraper:
                     description_elem = card.find('div', class_='job-snippet')
                     description = description_elem.text.strip() if description_elem else ""
                     
-                    job = {
-                        'title': title,
-                        'company': company,
-                        'location': location,
-                        'salary': salary,
-                        'description': description,
-                        'link': link,
-                        'source': 'Indeed'
-                    }
+                    job = JobRecord(
+                        title=title,
+                        company=company,
+                        location=location,
+                        link=link,
+                        source='Indeed',
+                        salary=salary,
+                        description=description,
+                        job_key=job_key
+                    )
                     
                     jobs.append(job)
                     
@@ -107,8 +184,6 @@ class IndeedScraper:
                     logging.warning(f"Failed to parse job card: {str(e)}")
                     continue
                     
-            self.jobs_data.extend(jobs)
-            logging.info(f"Found {len(jobs)} jobs")
             return jobs
             
         except Exception as e:
@@ -122,17 +197,17 @@ class IndeedScraper:
                     return False
                     
             self.driver.get(job_url)
-            time.sleep(3)
+            self.browser.pause(3)
             
             # Look for the Apply button
             try:
-                apply_button = WebDriverWait(self.driver, 10).until(
+                apply_button = self.browser.wait(10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='jobsearch-IndeedApplyButton']"))
                 )
                 apply_button.click()
                 
                 # Switch to the application iframe if present
-                time.sleep(3)
+                self.browser.pause(3)
                 iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
                 if iframes:
                     self.driver.switch_to.frame(iframes[0])
@@ -156,16 +231,16 @@ class IndeedScraper:
             resume_upload = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
             if resume_upload:
                 resume_upload[0].send_keys(self.config['resume_path'])
-                time.sleep(2)
+                self.browser.pause(2)
             
             # Continue button - might need to click multiple times
             for _ in range(3):
                 try:
-                    continue_button = WebDriverWait(self.driver, 5).until(
+                    continue_button = self.browser.wait(5).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
                     )
                     continue_button.click()
-                    time.sleep(2)
+                    self.browser.pause(2)
                 except:
                     break
                     
@@ -173,6 +248,7 @@ class IndeedScraper:
             logging.error(f"Error filling application form: {str(e)}")
             
     def save_jobs_to_csv(self, filename='jobs.csv'):
-        df = pd.DataFrame(self.jobs_data)
+        filename = self.browser.output_path(filename)
+        df = pd.DataFrame([job.to_dict() for job in self.jobs_data])
         df.to_csv(filename, index=False)
         return filename
\ No newline at end of file
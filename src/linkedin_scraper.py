@@ -1,13 +1,14 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import logging
 import json
+from urllib.parse import quote, urlparse, parse_qs
+import re
+from job_record import JobRecord
 
 class LinkedInScraper:
     def __init__(self, browser_handler):
@@ -23,7 +24,7 @@ class LinkedInScraper:
             
         try:
             self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
+            self.browser.pause(2)
             
             # Enter email
             email_field = self.browser.wait_for_element(By.ID, "username")
@@ -35,7 +36,7 @@ class LinkedInScraper:
             password_field.send_keys(Keys.RETURN)
             
             # Wait for login to complete
-            time.sleep(5)
+            self.browser.pause(5)
             self.logged_in = True
             logging.info("Successfully logged into LinkedIn")
             return True
@@ -47,12 +48,12 @@ class LinkedInScraper:
     def search_jobs(self, keyword, location):
         try:
             # Format the URL for LinkedIn job search
-            keyword = keyword.replace(' ', '%20')
-            location = location.replace(' ', '%20')
+            keyword = quote(keyword)
+            location = quote(location)
             search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&location={location}&f_TPR=r604800&f_WT=2"
             
             self.driver.get(search_url)
-            time.sleep(3)
+            self.browser.pause(3)
             return self._extract_job_listings()
             
         except Exception as e:
@@ -71,7 +72,7 @@ class LinkedInScraper:
                 try:
                     # Click the job card to load details
                     card.click()
-                    time.sleep(1)
+                    self.browser.pause(1)
                     
                     # Extract job details
                     title = self.driver.find_element(By.CLASS_NAME, "jobs-unified-top-card__job-title").text
@@ -85,14 +86,17 @@ class LinkedInScraper:
                     except:
                         easy_apply = False
                     
-                    job = {
-                        'title': title,
-                        'company': company,
-                        'location': location,
-                        'easy_apply': easy_apply,
-                        'link': self.driver.current_url,
-                        'source': 'LinkedIn'
-                    }
+                    # The search URL changes with the query, so link jobs by their posting ID
+                    job_key = self._job_id_from_url(self.driver.current_url)
+                    job = JobRecord(
+                        title=title,
+                        company=company,
+                        location=location,
+                        link=f"https://www.linkedin.com/jobs/view/{job_key}/" if job_key else self.driver.current_url,
+                        source='LinkedIn',
+                        job_key=job_key,
+                        easy_apply=easy_apply
+                    )
                     
                     if easy_apply:
                         jobs.append(job)
@@ -109,12 +113,22 @@ class LinkedInScraper:
             logging.error(f"Error extracting job listings: {str(e)}")
             return []
     
+    @staticmethod
+    def _job_id_from_url(url):
+        """Get the posting ID from a search URL's currentJobId or a /jobs/view/ URL."""
+        parsed = urlparse(url)
+        current_job_id = parse_qs(parsed.query).get('currentJobId')
+        if current_job_id:
+            return current_job_id[0]
+        match = re.search(r'/jobs/view/(?:[^/]*?-)?(\d+)', parsed.path)
+        return match.group(1) if match else None
+    
     def _scroll_jobs_list(self):
         """Scroll through the jobs list to load more results"""
         jobs_list = self.driver.find_element(By.CLASS_NAME, "jobs-search-results-list")
         for _ in range(5):  # Scroll 5 times
             self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", jobs_list)
-            time.sleep(1)
+            self.browser.pause(1)
     
     def apply_to_job(self, job_url):
         try:
@@ -123,7 +137,7 @@ class LinkedInScraper:
                     return False
             
             self.driver.get(job_url)
-            time.sleep(3)
+            self.browser.pause(3)
             
             # Find and click the Easy Apply button
             try:
@@ -140,7 +154,7 @@ class LinkedInScraper:
                 apply_button = None
                 for selector in button_selectors:
                     try:
-                        apply_button = WebDriverWait(self.driver, 5).until(
+                        apply_button = self.browser.wait(5).until(
                             EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                         )
                         if "Easy Apply" in apply_button.text or "Apply" in apply_button.text:
@@ -155,12 +169,12 @@ class LinkedInScraper:
                 # Try to click the button, handling any overlay issues
                 try:
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", apply_button)
-                    time.sleep(1)
+                    self.browser.pause(1)
                     apply_button.click()
                 except ElementClickInterceptedException:
                     self.driver.execute_script("arguments[0].click();", apply_button)
                 
-                time.sleep(2)
+                self.browser.pause(2)
                 return self._handle_application_flow()
                 
             except Exception as e:
@@ -184,7 +198,7 @@ class LinkedInScraper:
             modal = None
             for selector in modal_selectors:
                 try:
-                    modal = WebDriverWait(self.driver, 5).until(
+                    modal = self.browser.wait(5).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                     )
                     break
@@ -200,13 +214,13 @@ class LinkedInScraper:
             max_steps = 10  # Maximum number of steps to prevent infinite loops
             
             while steps_completed < max_steps:
-                time.sleep(2)
+                self.browser.pause(2)
                 
                 # Handle resume upload if needed
                 try:
                     resume_upload = self.driver.find_element(By.CSS_SELECTOR, "input[type='file']")
                     resume_upload.send_keys(self.config['resume_path'])
-                    time.sleep(2)
+                    self.browser.pause(2)
                 except:
                     pass
                 
@@ -243,7 +257,7 @@ class LinkedInScraper:
                         text = button.text.lower()
                         if 'submit' in text:
                             button.click()
-                            time.sleep(2)
+                            self.browser.pause(2)
                             logging.info("Application submitted successfully")
                             return True
                         elif any(action in text for action in ['next', 'review', 'continue']):
@@ -254,7 +268,7 @@ class LinkedInScraper:
                 if next_button:
                     try:
                         self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                        time.sleep(1)
+                        self.browser.pause(1)
                         next_button.click()
                         steps_completed += 1
                         continue
@@ -272,7 +286,7 @@ class LinkedInScraper:
                     if footer_buttons:
                         footer_buttons[-1].click()
                         steps_completed += 1
-                        time.sleep(2)
+                        self.browser.pause(2)
                         continue
                 except:
                     pass
@@ -292,6 +306,7 @@ class LinkedInScraper:
             return False
     
     def save_jobs_to_csv(self, filename='linkedin_jobs.csv'):
-        df = pd.DataFrame(self.jobs_data)
+        filename = self.browser.output_path(filename)
+        df = pd.DataFrame([job.to_dict() for job in self.jobs_data])
         df.to_csv(filename, index=False)
         return filename
\ No newline at end of file
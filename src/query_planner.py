@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+
+# Boolean OR syntax for sites whose search box accepts it
+OR_QUERY_FORMATS = {
+    'Indeed': lambda keywords: '(' + ' or '.join(f'"{k}"' for k in keywords) + ')',
+    'LinkedIn': lambda keywords: ' OR '.join(f'"{k}"' for k in keywords)
+}
+
+class QueryPlanner:
+    """Plans the keyword x location searches for a run.
+
+    Each keyword is searched separately at first, and the share of new jobs
+    each query contributed in earlier runs is tracked. Keywords that keep
+    returning jobs already found by other queries are merged into a single
+    OR query where the site supports it, or skipped where it doesn't. A
+    merged query that still adds little is skipped as well.
+    """
+
+    def __init__(self, config, site, stats_path='query_stats.json'):
+        self.site = site
+        self.keywords = config['job_search']['keywords']
+        self.locations = config['job_search']['locations']
+        planner_config = config.get('query_planner', {})
+        self.merge_keywords = planner_config.get('merge_keywords', True)
+        self.min_marginal_yield = planner_config.get('min_marginal_yield', 0.1)
+        self.min_runs = planner_config.get('min_runs', 3)
+        self.reprobe_every = planner_config.get('reprobe_every', 5)
+        self.stats_path = stats_path
+        self.stats = self._load_stats()
+        self.seen_jobs = set()
+        self.searches = []
+
+    def _load_stats(self):
+        if os.path.exists(self.stats_path):
+            with open(self.stats_path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def _save_stats(self):
+        with open(self.stats_path, 'w') as f:
+            json.dump(self.stats, f, indent=2)
+
+    def _stats_key(self, query, location):
+        return f"{self.site}|{query}|{location}"
+
+    def _marginal_yield(self, stats):
+        if not stats['found']:
+            return 0.0
+        return stats['new'] / stats['found']
+
+    def _should_skip(self, query, location):
+        stats = self.stats.get(self._stats_key(query, location))
+        if not stats or stats['runs'] < self.min_runs:
+            return False
+        if self._marginal_yield(stats) >= self.min_marginal_yield:
+            return False
+
+        # Re-run skipped queries now and then so their stats don't go stale
+        stats['skipped'] = stats.get('skipped', 0) + 1
+        if stats['skipped'] >= self.reprobe_every:
+            stats['skipped'] = 0
+            return False
+        return True
+
+    def plan(self):
+        """Return the (query, location) pairs to search in this run."""
+        planned = []
+        for location in self.locations:
+            low_yield = []
+            for index, keyword in enumerate(self.keywords):
+                # Always keep the first keyword so every location gets searched
+                if index > 0 and self._should_skip(keyword, location):
+                    low_yield.append(keyword)
+                    continue
+                planned.append((keyword, location))
+
+            if len(low_yield) > 1 and self.merge_keywords and self.site in OR_QUERY_FORMATS:
+                query = OR_QUERY_FORMATS[self.site](low_yield)
+                if self._should_skip(query, location):
+                    logging.info(f"Skipping low-yield search for {query} in {location}")
+                else:
+                    logging.info(f"Merging low-yield keywords into {query} for {location}")
+                    planned.append((query, location))
+            else:
+                for keyword in low_yield:
+                    logging.info(f"Skipping low-yield search for {keyword} in {location}")
+        self._save_stats()
+        return planned
+
+    def job_id(self, job):
+        return job.get('job_key') or job['link']
+
+    def record(self, query, location, jobs):
+        """Record a search's results and return only the jobs not seen earlier in this run."""
+        new_jobs = []
+        for job in jobs:
+            job_id = self.job_id(job)
+            if job_id not in self.seen_jobs:
+                self.seen_jobs.add(job_id)
+                new_jobs.append(job)
+
+        stats = self.stats.setdefault(
+            self._stats_key(query, location),
+            {'runs': 0, 'found': 0, 'new': 0}
+        )
+        stats['runs'] += 1
+        stats['found'] += len(jobs)
+        stats['new'] += len(new_jobs)
+        self._save_stats()
+
+        self.searches.append({
+            'query': query,
+            'location': location,
+            'found': len(jobs),
+            'new': len(new_jobs)
+        })
+        return new_jobs
+
+    def summary(self):
+        searches_issued = len(self.searches)
+        unique_jobs = len(self.seen_jobs)
+        return {
+            'searches_issued': searches_issued,
+            'unique_jobs': unique_jobs,
+            'yield_per_search': unique_jobs / searches_issued if searches_issued else 0.0,
+            'searches': self.searches
+        }
+
+    def log_summary(self):
+        summary = self.summary()
+        logging.info(
+            f"Issued {summary['searches_issued']} searches, found {summary['unique_jobs']} unique jobs "
+            f"({summary['yield_per_search']:.1f} per search)"
+        )
+        for search in summary['searches']:
+            logging.info(
+                f"  {search['query']} in {search['location']}: "
+                f"{search['new']} new of {search['found']} found"
+            )
+        return summary
@@ -0,0 +1,355 @@
+from selenium.common.exceptions import NoSuchElementException, InvalidSelectorException
+from selenium.webdriver.common.by import By
+from bs4 import BeautifulSoup
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+
+ARCHIVE_VERSION = 2
+
+# Events that change the page; snapshots taken between them are passive reads
+ACTION_EVENTS = ('get', 'click', 'script')
+
+def save_archive(path, events, pages, state):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump({'version': ARCHIVE_VERSION, 'events': events, 'pages': pages, 'state': state}, f)
+
+def load_archive(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        archive = json.load(f)
+    if archive.get('version') != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported capture archive version: {archive.get('version')}")
+    return archive['events'], archive['pages'], archive['state']
+
+def _read_state_file(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _serializable(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return None
+
+
+class RecordingDriver:
+    """Wraps a live WebDriver and records what the scrapers see.
+
+    Every navigation, element click and script call is logged with its
+    timing and a snapshot of the page afterwards, and the page is
+    snapshotted again whenever the scrapers read it. Page HTML is stored once
+    per distinct content and the whole capture is written as gzipped JSON
+    when the driver quits, along with the state files the run depends on.
+    """
+
+    def __init__(self, driver, archive_path):
+        self._driver = driver
+        self.archive_path = archive_path
+        self.events = []
+        self.pages = {}
+        self.state = {}
+        self._end_state_paths = set()
+        self._started = time.monotonic()
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def _snapshot(self):
+        try:
+            html = self._driver.page_source
+        except Exception:
+            return None
+        page_id = hashlib.sha1(html.encode('utf-8')).hexdigest()
+        self.pages.setdefault(page_id, html)
+        return page_id
+
+    def _current_url(self):
+        try:
+            return self._driver.current_url
+        except Exception:
+            return None
+
+    def _record(self, event_type, started, **fields):
+        # Recording must never replace the error the scrapers are handling
+        event = {
+            'type': event_type,
+            'at': round(started - self._started, 3),
+            'elapsed': round(time.monotonic() - started, 3),
+            'url': self._current_url(),
+            'page': self._snapshot()
+        }
+        event.update(fields)
+        self.events.append(event)
+
+    def get(self, url):
+        started = time.monotonic()
+        self._driver.get(url)
+        self._record('get', started, requested_url=url)
+
+    @property
+    def page_source(self):
+        self._record('snapshot', time.monotonic())
+        page_id = self.events[-1]['page']
+        return self.pages[page_id] if page_id else self._driver.page_source
+
+    def execute_script(self, script, *args):
+        started = time.monotonic()
+        result = self._driver.execute_script(script, *[_unwrap(arg) for arg in args])
+        self._record('script', started, result=_serializable(result))
+        return _wrap(result, self)
+
+    def find_element(self, by=By.ID, value=None):
+        # Snapshot after the lookup, which may have waited for the element to appear
+        started = time.monotonic()
+        try:
+            return RecordingElement(self._driver.find_element(by, value), self)
+        finally:
+            self._record('snapshot', started)
+
+    def find_elements(self, by=By.ID, value=None):
+        started = time.monotonic()
+        try:
+            return [RecordingElement(element, self) for element in self._driver.find_elements(by, value)]
+        finally:
+            self._record('snapshot', started)
+
+    @property
+    def switch_to(self):
+        return _RecordingSwitchTo(self._driver.switch_to)
+
+    def track_state(self, path, capture='start'):
+        """Store a state file in the capture, as it is now or as it is when the run ends."""
+        if capture == 'end':
+            self._end_state_paths.add(path)
+        elif path not in self.state:
+            self.state[path] = _read_state_file(path)
+
+    def quit(self):
+        try:
+            for path in self._end_state_paths:
+                self.state[path] = _read_state_file(path)
+            save_archive(self.archive_path, self.events, self.pages, self.state)
+            logging.info(f"Saved {len(self.events)} captured browser events to {self.archive_path}")
+        finally:
+            self._driver.quit()
+
+
+class RecordingElement:
+    def __init__(self, element, recorder):
+        self._element = element
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._element, name)
+
+    def click(self):
+        started = time.monotonic()
+        self._element.click()
+        self._recorder._record('click', started)
+
+    def find_element(self, by=By.ID, value=None):
+        return RecordingElement(self._element.find_element(by, value), self._recorder)
+
+    def find_elements(self, by=By.ID, value=None):
+        return [RecordingElement(element, self._recorder) for element in self._element.find_elements(by, value)]
+
+
+class _RecordingSwitchTo:
+    def __init__(self, switch_to):
+        self._switch_to = switch_to
+
+    def __getattr__(self, name):
+        return getattr(self._switch_to, name)
+
+    def frame(self, frame_reference):
+        return self._switch_to.frame(_unwrap(frame_reference))
+
+def _unwrap(value):
+    return value._element if isinstance(value, RecordingElement) else value
+
+def _wrap(value, recorder):
+    if isinstance(value, list):
+        return [_wrap(item, recorder) for item in value]
+    if hasattr(value, 'find_element') and not isinstance(value, RecordingElement):
+        return RecordingElement(value, recorder)
+    return value
+
+
+class ReplayDriver:
+    """Driver-compatible stand-in that serves a recorded capture offline.
+
+    Calls are matched against the capture in the order they were recorded,
+    so the same scraper code path sees the same pages and script results.
+    Element lookups run against the recorded HTML. Recorded page load times
+    are replayed multiplied by delay_scale (0 removes them).
+    """
+
+    def __init__(self, archive_path, delay_scale=0.0):
+        self.events, self.pages, self.state = load_archive(archive_path)
+        self.delay_scale = delay_scale
+        self.current_url = "about:blank"
+        self._page_source = "<html><head></head><body></body></html>"
+        self.switch_to = _ReplaySwitchTo()
+        self._cursor = 0
+        self._soup = None
+
+    def _next_event(self, event_type, requested_url=None):
+        """Find the next matching event before the following navigation."""
+        for index in range(self._cursor, len(self.events)):
+            event = self.events[index]
+            if event_type == 'get':
+                if event['type'] == 'get' and event.get('requested_url') == requested_url:
+                    return index, event
+            elif event['type'] == 'get':
+                break
+            elif event['type'] == event_type:
+                return index, event
+        return None, None
+
+    def _latest_snapshot(self):
+        """Move to the last page read before the next action.
+
+        Snapshots are not matched one by one because waits poll the page a
+        different number of times when replayed.
+        """
+        latest = None
+        for index in range(self._cursor, len(self.events)):
+            if self.events[index]['type'] in ACTION_EVENTS:
+                break
+            latest = index
+        if latest is not None:
+            self._apply(latest, self.events[latest])
+
+    def _apply(self, index, event):
+        self._cursor = index + 1
+        if event['url']:
+            self.current_url = event['url']
+        if event.get('page') in self.pages:
+            self._page_source = self.pages[event['page']]
+            self._soup = None
+        if self.delay_scale and event['type'] in ACTION_EVENTS:
+            time.sleep(event['elapsed'] * self.delay_scale)
+
+    def get(self, url):
+        index, event = self._next_event('get', url)
+        if event is None:
+            logging.warning(f"No recorded page for {url}, serving a blank page")
+            self.current_url = url
+            self._page_source = "<html><head></head><body></body></html>"
+            self._soup = None
+            return
+        self._apply(index, event)
+
+    def _click(self):
+        index, event = self._next_event('click')
+        if event is not None:
+            self._apply(index, event)
+
+    def execute_script(self, script, *args):
+        index, event = self._next_event('script')
+        if event is None:
+            return None
+        self._apply(index, event)
+        return event.get('result')
+
+    @property
+    def page_source(self):
+        self._latest_snapshot()
+        return self._page_source
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            self._soup = BeautifulSoup(self._page_source, 'html.parser')
+        return self._soup
+
+    def find_element(self, by=By.ID, value=None):
+        self._latest_snapshot()
+        return _find_element(self.soup, by, value, self)
+
+    def find_elements(self, by=By.ID, value=None):
+        self._latest_snapshot()
+        return _find_elements(self.soup, by, value, self)
+
+    def get_cookies(self):
+        return []
+
+    def implicitly_wait(self, time_to_wait):
+        pass
+
+    def quit(self):
+        pass
+
+
+class ReplayElement:
+    def __init__(self, tag, driver):
+        self._tag = tag
+        self._driver = driver
+
+    @property
+    def text(self):
+        return self._tag.get_text(" ", strip=True)
+
+    @property
+    def tag_name(self):
+        return self._tag.name
+
+    def get_attribute(self, name):
+        value = self._tag.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_element(self._tag, by, value, self._driver)
+
+    def find_elements(self, by=By.ID, value=None):
+        return _find_elements(self._tag, by, value, self._driver)
+
+    def click(self):
+        self._driver._click()
+
+    def send_keys(self, *value):
+        pass
+
+    def clear(self):
+        pass
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return not self._tag.has_attr('disabled')
+
+
+class _ReplaySwitchTo:
+    def frame(self, frame_reference):
+        pass
+
+    def default_content(self):
+        pass
+
+def _css_selector(by, value):
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return f'.{value}'
+    if by == By.NAME:
+        return f'[name="{value}"]'
+    if by in (By.TAG_NAME, By.CSS_SELECTOR):
+        return value
+    raise InvalidSelectorException(f"Locator strategy '{by}' is not supported in replay")
+
+def _find_elements(root, by, value, driver):
+    return [ReplayElement(tag, driver) for tag in root.select(_css_selector(by, value))]
+
+def _find_element(root, by, value, driver):
+    tag = root.select_one(_css_selector(by, value))
+    if tag is None:
+        raise NoSuchElementException(f"No recorded element matches {by}={value}")
+    return ReplayElement(tag, driver)
@@ -0,0 +1,43 @@
+import json
+import os
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+sys.path.insert(0, SRC_DIR)
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture
+def config():
+    with open(os.path.join(SRC_DIR, '..', 'config', 'config.json'), 'r') as f:
+        return json.load(f)
+
+
+class FakeDriver:
+    """Serves a fixed page in place of a live WebDriver."""
+
+    def __init__(self, page_source=""):
+        self.page_source = page_source
+        self.current_url = "about:blank"
+
+
+class FakeBrowser:
+    def __init__(self, config, page_source=""):
+        self.config = config
+        self.driver = FakeDriver(page_source)
+        self.mode = 'live'
+
+    def pause(self, seconds):
+        pass
+
+
+@pytest.fixture
+def fake_browser(config):
+    return FakeBrowser(config)
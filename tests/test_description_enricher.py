@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import load_fixture
+from description_enricher import DescriptionEnricher
+from indeed_agent import IndeedAgent
+from job_record import JobRecord
+
+RESPONSE_DELAY = 0.2
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FixtureHandler)
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(RESPONSE_DELAY)
+        with server.lock:
+            server.active -= 1
+
+        if self.path.startswith('/viewjob'):
+            body = load_fixture('indeed_viewjob.html').encode('utf-8')
+            self.send_response(200)
+        else:
+            body = b'Not found'
+            self.send_response(404)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = FixtureServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def enricher(config, tmp_path):
+    config['description_enrichment'] = {'max_workers': {'Indeed': 4}, 'timeout': 5}
+    return DescriptionEnricher(config, 'Indeed', cache_path=str(tmp_path / 'cache.json'))
+
+
+def make_job(server, job_key, path=None, title='Machine Learning Engineer'):
+    return JobRecord(
+        title=title, company='Acme AI', location='Remote',
+        link=server.url(path or f'/viewjob?jk={job_key}'), source='Indeed',
+        description='Join our applied research team.', job_key=job_key
+    )
+
+
+def test_fetches_descriptions_concurrently(server, enricher):
+    jobs = [make_job(server, f'job{i}') for i in range(4)]
+
+    started = time.monotonic()
+    enricher.enrich(jobs)
+    elapsed = time.monotonic() - started
+
+    assert server.max_active > 1
+    assert elapsed < RESPONSE_DELAY * len(jobs)
+    for job in jobs:
+        assert 'deep learning models with TensorFlow' in job['description']
+        assert job['snippet'] == 'Join our applied research team.'
+
+
+def test_cached_descriptions_skip_the_network(server, enricher, config, tmp_path):
+    enricher.enrich([make_job(server, 'job1')])
+    assert len(server.requests) == 1
+
+    job = make_job(server, 'job1')
+    enricher.enrich([job])
+    assert len(server.requests) == 1
+    assert 'TensorFlow' in job['description']
+
+    # The cache survives into the next run
+    next_run = DescriptionEnricher(config, 'Indeed', cache_path=str(tmp_path / 'cache.json'))
+    next_run.enrich([make_job(server, 'job1')])
+    assert len(server.requests) == 1
+
+
+def test_failed_fetch_keeps_the_snippet(server, enricher):
+    job = make_job(server, 'gone', path='/missing')
+    enricher.enrich([job])
+
+    assert server.requests == ['/missing']
+    assert job['description'] == 'Join our applied research team.'
+    assert job['snippet'] is None
+    assert 'gone' not in enricher.cache
+
+
+def test_cache_drops_expired_and_excess_entries(config, tmp_path):
+    now = time.time()
+    cache_path = tmp_path / 'cache.json'
+    cache_path.write_text(json.dumps({
+        'old': {'description': 'old', 'fetched_at': now - 40 * 24 * 60 * 60},
+        'a': {'description': 'a', 'fetched_at': now - 3},
+        'b': {'description': 'b', 'fetched_at': now - 2},
+        'c': {'description': 'c', 'fetched_at': now - 1},
+        'legacy': 'plain description'
+    }))
+    config['description_enrichment'] = {'cache_max_entries': 2, 'cache_max_age_days': 30}
+
+    enricher = DescriptionEnricher(config, 'Indeed', cache_path=str(cache_path))
+    assert list(enricher.cache) == ['c', 'b']
+
+
+def test_filter_reruns_on_full_description(server, enricher, config):
+    config['auto_apply']['required_keywords'] = ['tensorflow']
+    agent = IndeedAgent.__new__(IndeedAgent)
+    agent.config = config
+    agent.applied_keys = set()
+    agent.enricher = enricher
+
+    matching = make_job(server, 'job1')
+    missing = make_job(server, 'gone', path='/missing')
+    excluded = make_job(server, 'job2', title='Senior Machine Learning Engineer')
+
+    assert agent._filter_jobs([matching, missing, excluded]) == [matching]
+    # Jobs already ruled out by title are never fetched
+    assert sorted(server.requests) == ['/missing', '/viewjob?jk=job1']
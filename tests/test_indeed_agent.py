@@ -0,0 +1,29 @@
+import pytest
+
+from conftest import load_fixture
+from indeed_agent import IndeedAgent
+from job_scraper import IndeedScraper
+
+
+def make_agent(config, applied_jobs):
+    agent = IndeedAgent.__new__(IndeedAgent)
+    agent.config = config
+    agent.applied_jobs = applied_jobs
+    agent.applied_keys = {agent._applied_key(applied_job) for applied_job in applied_jobs}
+    return agent
+
+
+@pytest.mark.parametrize('fixture', ['indeed_results_embedded.html', 'indeed_results_dom.html'])
+def test_already_applied_jobs_are_filtered_whatever_the_link_form(fake_browser, config, fixture):
+    applied_jobs = [
+        # Written before links were canonical
+        {'title': 'Machine Learning Engineer', 'company': 'Acme AI',
+         'link': 'https://www.indeed.com/rc/clk?jk=a1b2c3d4e5f60001&from=serp'},
+        {'title': 'Data Scientist', 'company': 'Globex',
+         'link': 'https://www.indeed.com/viewjob?jk=a1b2c3d4e5f60002', 'job_key': 'a1b2c3d4e5f60002'}
+    ]
+    agent = make_agent(config, applied_jobs)
+    fake_browser.driver.page_source = load_fixture(fixture)
+    jobs = IndeedScraper(fake_browser)._extract_job_listings()
+
+    assert [job['job_key'] for job in jobs if agent._prefilter_job(job)] == ['a1b2c3d4e5f60003']
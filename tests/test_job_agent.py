@@ -0,0 +1,28 @@
+from job_agent import JobAgent
+from job_record import JobRecord
+
+
+def make_job(job_key, title='Machine Learning Engineer'):
+    return JobRecord(
+        title=title, company='Acme AI', location='Remote',
+        link=f'https://www.linkedin.com/jobs/view/{job_key}/', source='LinkedIn',
+        job_key=job_key, easy_apply=True
+    )
+
+
+def test_already_applied_jobs_are_filtered_whatever_the_link_form(config):
+    config['auto_apply']['required_keywords'] = ['machine learning']
+    applied_jobs = [
+        # Written before links were canonical
+        {'title': 'Machine Learning Engineer', 'company': 'Acme AI',
+         'link': 'https://www.linkedin.com/jobs/search/?currentJobId=3912345671&keywords=ML%20Engineer&location=Remote'},
+        {'title': 'Machine Learning Engineer', 'company': 'Acme AI',
+         'link': 'https://www.linkedin.com/jobs/view/3912345672/', 'job_key': '3912345672'}
+    ]
+    agent = JobAgent.__new__(JobAgent)
+    agent.config = config
+    agent.applied_jobs = applied_jobs
+    agent.applied_keys = {agent._applied_key(applied_job) for applied_job in applied_jobs}
+
+    jobs = [make_job('3912345671'), make_job('3912345672'), make_job('3912345673')]
+    assert [job['job_key'] for job in jobs if agent._filter_job(job)] == ['3912345673']
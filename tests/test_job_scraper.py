@@ -0,0 +1,76 @@
+from conftest import load_fixture
+from job_scraper import IndeedScraper
+
+EXPECTED_KEYS = ['a1b2c3d4e5f60001', 'a1b2c3d4e5f60002', 'a1b2c3d4e5f60003']
+
+
+def test_embedded_extraction_returns_rich_records(fake_browser):
+    scraper = IndeedScraper(fake_browser)
+    jobs = scraper._extract_embedded_job_listings(load_fixture('indeed_results_embedded.html'))
+
+    assert [job['job_key'] for job in jobs] == EXPECTED_KEYS
+    first = jobs[0]
+    assert first['title'] == 'Machine Learning Engineer'
+    assert first['company'] == 'Acme AI'
+    assert first['location'] == 'Remote'
+    assert first['link'] == 'https://www.indeed.com/viewjob?jk=a1b2c3d4e5f60001'
+    assert first['description'] == 'Build PyTorch models for NLP.'
+    assert first['salary'] == '₹12,00,000 - ₹18,00,000 a year'
+    assert (first['salary_min'], first['salary_max'], first['salary_type']) == (1200000, 1800000, 'yearly')
+    assert first['posted_date'] == '2025-10-17T00:00:00+00:00'
+    assert jobs[1]['posted_date'] == '2025-10-16T00:00:00+00:00'
+    assert jobs[1]['salary'] == 'Not specified'
+    assert jobs[2]['posted_date'] is None
+
+
+def test_embedded_extraction_returns_none_without_payload(fake_browser):
+    scraper = IndeedScraper(fake_browser)
+    assert scraper._extract_embedded_job_listings(load_fixture('indeed_results_dom.html')) is None
+
+
+def test_embedded_extraction_returns_none_for_malformed_payload(fake_browser):
+    scraper = IndeedScraper(fake_browser)
+    page = '<script>window.mosaic.providerData["mosaic-provider-jobcards"]={"metaData":{}};</script>'
+    assert scraper._extract_embedded_job_listings(page) is None
+
+
+def test_extract_job_listings_prefers_embedded_payload(fake_browser):
+    fake_browser.driver.page_source = load_fixture('indeed_results_embedded.html')
+    scraper = IndeedScraper(fake_browser)
+    jobs = scraper._extract_job_listings()
+
+    assert [job['job_key'] for job in jobs] == EXPECTED_KEYS
+    assert all(job['posted_date'] or job['job_key'] == EXPECTED_KEYS[2] for job in jobs)
+    assert scraper.jobs_data == jobs
+
+
+def test_extract_job_listings_falls_back_to_dom(fake_browser):
+    fake_browser.driver.page_source = load_fixture('indeed_results_dom.html')
+    scraper = IndeedScraper(fake_browser)
+    jobs = scraper._extract_job_listings()
+
+    assert [job['job_key'] for job in jobs] == EXPECTED_KEYS
+    first = jobs[0]
+    assert first['title'] == 'Machine Learning Engineer'
+    assert first['company'] == 'Acme AI'
+    assert first['location'] == 'Remote'
+    assert first['link'] == 'https://www.indeed.com/viewjob?jk=a1b2c3d4e5f60001'
+    assert first['salary'] == '₹12,00,000 - ₹18,00,000 a year'
+    assert first['posted_date'] is None
+    assert jobs[1]['salary'] == 'Not specified'
+
+
+def test_both_parsers_build_the_same_links(fake_browser):
+    scraper = IndeedScraper(fake_browser)
+    embedded = scraper._extract_embedded_job_listings(load_fixture('indeed_results_embedded.html'))
+    dom = scraper._extract_dom_job_listings(load_fixture('indeed_results_dom.html'))
+
+    assert [job['link'] for job in embedded] == [job['link'] for job in dom]
+
+
+def test_dom_job_key_falls_back_to_link(fake_browser):
+    page = load_fixture('indeed_results_dom.html').replace('data-jk="a1b2c3d4e5f60001" ', '')
+    jobs = IndeedScraper(fake_browser)._extract_dom_job_listings(page)
+
+    assert jobs[0]['job_key'] == 'a1b2c3d4e5f60001'
+    assert jobs[0]['link'] == 'https://www.indeed.com/viewjob?jk=a1b2c3d4e5f60001'
@@ -0,0 +1,14 @@
+import pytest
+
+from linkedin_scraper import LinkedInScraper
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://www.linkedin.com/jobs/search/?currentJobId=3912345678&keywords=ML%20Engineer&location=Remote', '3912345678'),
+    ('https://www.linkedin.com/jobs/search/?currentJobId=3912345678&keywords=AI%20Engineer&location=Chennai', '3912345678'),
+    ('https://www.linkedin.com/jobs/view/3912345678/', '3912345678'),
+    ('https://www.linkedin.com/jobs/view/machine-learning-engineer-at-acme-3912345678', '3912345678'),
+    ('https://www.linkedin.com/jobs/search/?keywords=ML%20Engineer', None),
+])
+def test_job_id_from_url(url, expected):
+    assert LinkedInScraper._job_id_from_url(url) == expected
@@ -0,0 +1,82 @@
+import pytest
+
+from job_record import JobRecord
+from query_planner import QueryPlanner
+
+
+@pytest.fixture
+def planner_config(config):
+    config['job_search']['keywords'] = ['ML Engineer', 'AI Engineer', 'Data Scientist']
+    config['job_search']['locations'] = ['Remote']
+    config['query_planner'] = {
+        'merge_keywords': True,
+        'min_marginal_yield': 0.1,
+        'min_runs': 2,
+        'reprobe_every': 3
+    }
+    return config
+
+
+def make_job(job_key):
+    return JobRecord(
+        title='ML Engineer', company='Acme', location='Remote',
+        link=f'https://www.linkedin.com/jobs/view/{job_key}/', source='LinkedIn', job_key=job_key
+    )
+
+
+def run_once(config, stats_path, site='LinkedIn'):
+    """Every query returns the same five postings."""
+    planner = QueryPlanner(config, site, str(stats_path))
+    plan = planner.plan()
+    for query, location in plan:
+        planner.record(query, location, [make_job(str(job_id)) for job_id in range(5)])
+    return plan, planner
+
+
+def test_first_run_searches_each_keyword(planner_config, tmp_path):
+    plan, planner = run_once(planner_config, tmp_path / 'stats.json')
+
+    assert plan == [('ML Engineer', 'Remote'), ('AI Engineer', 'Remote'), ('Data Scientist', 'Remote')]
+    summary = planner.summary()
+    assert summary['searches_issued'] == 3
+    assert summary['unique_jobs'] == 5
+    assert [search['new'] for search in summary['searches']] == [5, 0, 0]
+
+
+def test_low_yield_keywords_are_merged(planner_config, tmp_path):
+    stats_path = tmp_path / 'stats.json'
+    for _ in range(2):
+        run_once(planner_config, stats_path)
+
+    plan, _ = run_once(planner_config, stats_path)
+    assert plan == [('ML Engineer', 'Remote'), ('"AI Engineer" OR "Data Scientist"', 'Remote')]
+
+
+def test_low_yield_merged_query_is_skipped_and_reprobed(planner_config, tmp_path):
+    stats_path = tmp_path / 'stats.json'
+    plans = [run_once(planner_config, stats_path)[0] for _ in range(8)]
+
+    merged = ('"AI Engineer" OR "Data Scientist"', 'Remote')
+    assert [merged in plan for plan in plans] == [False, False, True, True, False, False, False, False]
+    # Every third skip the individual keywords are searched again to refresh their stats
+    assert ('AI Engineer', 'Remote') in plans[4] and ('AI Engineer', 'Remote') in plans[7]
+    assert plans[5] == plans[6] == [('ML Engineer', 'Remote')]
+
+
+def test_low_yield_keywords_are_skipped_without_merging(planner_config, tmp_path):
+    planner_config['query_planner']['merge_keywords'] = False
+    stats_path = tmp_path / 'stats.json'
+    for _ in range(2):
+        run_once(planner_config, stats_path)
+
+    plan, _ = run_once(planner_config, stats_path)
+    assert plan == [('ML Engineer', 'Remote')]
+
+
+def test_record_returns_only_unseen_jobs(planner_config, tmp_path):
+    planner = QueryPlanner(planner_config, 'LinkedIn', str(tmp_path / 'stats.json'))
+    first = planner.record('ML Engineer', 'Remote', [make_job('1'), make_job('2')])
+    second = planner.record('AI Engineer', 'Remote', [make_job('2'), make_job('3')])
+
+    assert [job['job_key'] for job in first] == ['1', '2']
+    assert [job['job_key'] for job in second] == ['3']
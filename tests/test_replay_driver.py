@@ -0,0 +1,226 @@
+import json
+import os
+import time
+
+from bs4 import BeautifulSoup
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from browser_handler import BrowserHandler
+from replay_driver import RecordingDriver, ReplayDriver, _css_selector
+
+SEARCH_URL = 'https://www.linkedin.com/jobs/search/?keywords=ML%20Engineer'
+RESULTS_PAGE = """<html><body>
+  <ul><li class="card" data-title="ML Engineer">ML Engineer</li><li class="card" data-title="AI Engineer">AI Engineer</li></ul>
+  <div class="detail"><h1 class="job-title">{title}</h1></div>
+</body></html>"""
+
+
+class FakeElement:
+    def __init__(self, tag, driver):
+        self.tag = tag
+        self.driver = driver
+
+    @property
+    def text(self):
+        return self.tag.get_text(strip=True)
+
+    def click(self):
+        # The detail pane only renders while the next lookup is waiting for it
+        self.driver.pending_html = RESULTS_PAGE.format(title=self.tag['data-title'])
+        self.driver.html = RESULTS_PAGE.format(title='Loading')
+
+
+class FakeLiveDriver:
+    """Stands in for Chrome with an implicit wait: lookups see late-rendered content."""
+
+    def __init__(self):
+        self.current_url = 'about:blank'
+        self.html = '<html></html>'
+        self.pending_html = None
+
+    @property
+    def page_source(self):
+        return self.html
+
+    def get(self, url):
+        self.current_url = url
+        self.html = RESULTS_PAGE.format(title='')
+
+    def execute_script(self, script, *args):
+        return 'Mozilla/5.0 (fake)'
+
+    def _settle(self):
+        if self.pending_html:
+            self.html, self.pending_html = self.pending_html, None
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(value)
+        return elements[0]
+
+    def find_elements(self, by, value):
+        self._settle()
+        soup = BeautifulSoup(self.html, 'html.parser')
+        return [FakeElement(tag, self) for tag in soup.select(_css_selector(by, value))]
+
+    def quit(self):
+        pass
+
+
+def scrape(driver):
+    """A LinkedIn-style pass: open the results, click each card, read the detail pane."""
+    driver.get(SEARCH_URL)
+    user_agent = driver.execute_script("return navigator.userAgent")
+    titles = []
+    for card in driver.find_elements(By.CLASS_NAME, 'card'):
+        card.click()
+        titles.append(driver.find_element(By.CLASS_NAME, 'job-title').text)
+    return user_agent, titles
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / 'captures' / 'capture.json.gz')
+
+
+def test_replay_matches_recorded_run(archive_path):
+    recorder = RecordingDriver(FakeLiveDriver(), archive_path)
+    recorded = scrape(recorder)
+    recorder.quit()
+
+    assert recorded == ('Mozilla/5.0 (fake)', ['ML Engineer', 'AI Engineer'])
+    assert scrape(ReplayDriver(archive_path)) == recorded
+
+
+class DeadDriver(FakeLiveDriver):
+    """A browser that has crashed: every call fails."""
+
+    @property
+    def current_url(self):
+        raise WebDriverException('chrome not reachable')
+
+    @current_url.setter
+    def current_url(self, value):
+        pass
+
+    @property
+    def page_source(self):
+        raise WebDriverException('chrome not reachable')
+
+    def find_elements(self, by, value):
+        return []
+
+
+def test_recording_keeps_the_lookup_error_when_the_browser_is_gone(archive_path):
+    recorder = RecordingDriver(DeadDriver(), archive_path)
+
+    with pytest.raises(NoSuchElementException):
+        recorder.find_element(By.ID, 'missing')
+    assert recorder.find_elements(By.ID, 'missing') == []
+    assert [(event['url'], event['page']) for event in recorder.events] == [(None, None), (None, None)]
+
+
+def test_replay_serves_blank_page_for_unrecorded_url(archive_path):
+    recorder = RecordingDriver(FakeLiveDriver(), archive_path)
+    recorder.quit()
+
+    replay = ReplayDriver(archive_path)
+    replay.get('https://www.indeed.com/jobs?q=ML')
+    assert replay.current_url == 'https://www.indeed.com/jobs?q=ML'
+    assert replay.find_elements(By.CLASS_NAME, 'card') == []
+    with pytest.raises(NoSuchElementException):
+        replay.find_element(By.ID, 'missing')
+
+
+def make_handler(mode, driver, replay_dir=None):
+    handler = BrowserHandler.__new__(BrowserHandler)
+    handler.mode = mode
+    handler.driver = driver
+    handler.replay_dir = replay_dir
+    handler.keep_replay_dir = False
+    handler._restored_state = set()
+    return handler
+
+
+def test_replay_restores_recorded_state_without_touching_live_files(archive_path, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'applied_jobs.json').write_text('[{"link": "https://www.linkedin.com/jobs/view/1/"}]')
+    (tmp_path / 'description_cache.json').write_text('{}')
+
+    recorder = make_handler('record', RecordingDriver(FakeLiveDriver(), archive_path))
+    assert recorder.state_path('applied_jobs.json') == 'applied_jobs.json'
+    assert recorder.state_path('query_stats.json') == 'query_stats.json'
+    assert recorder.state_path('description_cache.json', capture='end') == 'description_cache.json'
+    # The recorded run applies to a job and caches a description
+    (tmp_path / 'applied_jobs.json').write_text('[{"link": "https://www.linkedin.com/jobs/view/1/"}, {"link": "x"}]')
+    (tmp_path / 'description_cache.json').write_text('{"job1": {"description": "full", "fetched_at": 0}}')
+    recorder.driver.quit()
+
+    replay_dir = tmp_path / 'replay'
+    replay_dir.mkdir()
+    replayer = make_handler('replay', ReplayDriver(archive_path), str(replay_dir))
+    applied_path = replayer.state_path('applied_jobs.json')
+    assert applied_path == str(replay_dir / 'applied_jobs.json')
+    assert json.loads(open(applied_path).read()) == [{'link': 'https://www.linkedin.com/jobs/view/1/'}]
+    assert not os.path.exists(replayer.state_path('query_stats.json'))
+    cache_path = replayer.state_path('description_cache.json', capture='end')
+    assert json.loads(open(cache_path).read())['job1']['description'] == 'full'
+    assert replayer.output_path('jobs.csv') == str(replay_dir / 'jobs.csv')
+
+    with open(applied_path, 'w') as f:
+        f.write('[]')
+    assert 'jobs/view/1/' in (tmp_path / 'applied_jobs.json').read_text()
+    assert '"x"' in (tmp_path / 'applied_jobs.json').read_text()
+
+
+def test_replay_waits_do_not_poll_when_delays_are_removed(archive_path):
+    recorder = RecordingDriver(FakeLiveDriver(), archive_path)
+    recorder.quit()
+    handler = make_handler('replay', ReplayDriver(archive_path))
+    handler.delay_scale = 0.0
+
+    started = time.monotonic()
+    for _ in range(5):
+        with pytest.raises(TimeoutException):
+            handler.wait(10).until(EC.presence_of_element_located((By.ID, 'missing')))
+    assert time.monotonic() - started < 0.5
+
+
+def record_applied_jobs(archive_path, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'applied_jobs.json').write_text('[]')
+    recorder = make_handler('record', RecordingDriver(FakeLiveDriver(), archive_path))
+    recorder.state_path('applied_jobs.json')
+    recorder.driver.quit()
+
+
+def test_temporary_replay_dir_is_removed_on_close(archive_path, tmp_path, monkeypatch, config):
+    record_applied_jobs(archive_path, tmp_path, monkeypatch)
+    replayer = make_handler('replay', ReplayDriver(archive_path))
+    replayer.config = config
+    replayer.replay_dir = replayer._setup_replay_dir()
+
+    assert os.path.exists(replayer.state_path('applied_jobs.json'))
+    replayer.close()
+    assert not os.path.exists(replayer.replay_dir)
+
+
+def test_kept_replay_dir_restarts_from_captured_state(archive_path, tmp_path, monkeypatch, config):
+    record_applied_jobs(archive_path, tmp_path, monkeypatch)
+    config['browser_settings']['replay_dir'] = str(tmp_path / 'replays')
+
+    for _ in range(2):
+        replayer = make_handler('replay', ReplayDriver(archive_path))
+        replayer.config = config
+        replayer.replay_dir = replayer._setup_replay_dir()
+        applied_path = replayer.state_path('applied_jobs.json')
+        assert open(applied_path).read() == '[]'
+        with open(applied_path, 'w') as f:
+            f.write('[{"link": "x"}]')
+        replayer.close()
+
+    assert os.path.exists(applied_path)